@@ -265,13 +265,9 @@ def _get_datadog_hostname(ctx: Dict[str, Any], level: int) -> str:
     # Default: empty string
     return ""
 
-def _build_grafana_payload(event_type: str, ctx: Dict[str, Any], level: int) -> Dict[str, Any]:
-    """Build payload in Grafana Loki format with streams array"""
-    # Build the original payload structure
-    original_payload = _build_payload(event_type, ctx, level)
-    
-    # Build stream labels for Grafana Loki
-    stream = {
+def _grafana_stream_labels(level: int) -> Dict[str, Any]:
+    """Build stream labels for Grafana Loki"""
+    return {
         "Language": "Python",
         "source": "Code",
         "sdk": "sfq",
@@ -280,6 +276,22 @@ def _build_grafana_payload(event_type: str, ctx: Dict[str, Any], level: int) ->
         "telemetry_level": str(level),
         "client_id": _client_id
     }
+
+
+# Stream labels only vary by telemetry level, so build them once per level;
+# payloads get a copy so queued events never share one labels dict
+_GRAFANA_STREAM_LABELS: Dict[int, Dict[str, Any]] = {
+    level: _grafana_stream_labels(level) for level in (-1, 0, 1, 2)
+}
+
+
+def _build_grafana_payload(event_type: str, ctx: Dict[str, Any], level: int) -> Dict[str, Any]:
+    """Build payload in Grafana Loki format with streams array"""
+    # Build the original payload structure
+    original_payload = _build_payload(event_type, ctx, level)
+    
+    labels = _GRAFANA_STREAM_LABELS.get(level)
+    stream = dict(labels) if labels is not None else _grafana_stream_labels(level)
     
     # Convert to Grafana Loki format with nanosecond timestamp
     return {
@@ -724,6 +736,7 @@ class _Sender(threading.Thread):
         self.user_id = user_id
         self.api_key = api_key
         self.provider = provider
+        self._headers = self._build_headers()
         self._q: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=500)
         self._stop = threading.Event()
 
@@ -752,27 +765,29 @@ class _Sender(threading.Thread):
             # drop telemetry if queue is full
             pass
 
-    def _post(self, event: Dict[str, Any]) -> None:
-        parsed = urlparse(self.endpoint)
-        conn = None
-        body = json.dumps(event).encode("utf-8")
-        
-        # Provider-specific authentication
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the provider-specific request headers once per sender."""
         if self.provider == "DATADOG":
             # DataDog uses API key header
-            headers = {
+            return {
                 "Content-Type": "application/json",
                 "DD-API-KEY": self.api_key
             }
-        else:
-            # Grafana Cloud authentication using Basic Auth
-            auth_string = f"{self.user_id}:{self.api_key}"
-            auth_header = f"Basic {base64.b64encode(auth_string.encode()).decode()}"
-            
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": auth_header
-            }
+
+        # Grafana Cloud authentication using Basic Auth
+        auth_string = f"{self.user_id}:{self.api_key}"
+        auth_header = f"Basic {base64.b64encode(auth_string.encode()).decode()}"
+
+        return {
+            "Content-Type": "application/json",
+            "Authorization": auth_header
+        }
+
+    def _post(self, event: Dict[str, Any]) -> None:
+        parsed = urlparse(self.endpoint)
+        conn = None
+        body = json.dumps(event).encode("utf-8")
+        headers = self._headers
 
         if parsed.scheme == "https":
             conn = http.client.HTTPSConnection(parsed.hostname or "", parsed.port or 443, timeout=5)
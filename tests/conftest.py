@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for the SFQ test suite.
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: test talks to a live Salesforce org"
+    )
+
+
+@pytest.fixture(scope="session")
+def sf_auth_instance():
+    """
+    Create a basic SFAuth instance shared across the test session.
+
+    The instance is only suitable for read-only introspection; tests that
+    exercise request paths should override this fixture with a
+    function-scoped instance.
+    """
+    # Imported here so modules that put ``src`` on sys.path themselves can
+    # still be collected when sfq is not installed.
+    from sfq import SFAuth
+
+    return SFAuth(
+        instance_url="https://test.my.salesforce.com",
+        client_id="test_client_id",
+        refresh_token="test_refresh_token",
+        client_secret="test_client_secret",
+    )
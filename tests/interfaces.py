@@ -14,14 +14,18 @@ Usage:
     pytest tests/2026feb_interfaces.py -v --tb=short
 """
 
+import functools
+import importlib
 import inspect
-import json
-from dataclasses import dataclass, field
+import itertools
+import types
 from typing import (
     Any,
     Callable,
     Dict,
-    get_type_hints,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -40,29 +44,68 @@ from sfq import (
 )
 
 
-@dataclass
 class InterfaceSignature:
     """Represents a captured interface signature for comparison."""
 
-    name: str
-    kind: str  # 'method', 'property', 'function', 'class', 'attribute'
-    parameters: Dict[str, Any] = field(default_factory=dict)
-    return_annotation: Optional[str] = None
-    default_values: Dict[str, Any] = field(default_factory=dict)
-    is_public: bool = True
-    docstring: Optional[str] = None
+    __slots__ = (
+        "name",
+        "kind",
+        "parameters",
+        "return_annotation",
+        "default_values",
+        "is_public",
+        "docstring",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,  # 'method', 'property', 'function', 'class', 'attribute'
+        parameters: Optional[Dict[str, Any]] = None,
+        return_annotation: Optional[str] = None,
+        default_values: Optional[Dict[str, Any]] = None,
+        is_public: bool = True,
+        docstring: Optional[str] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        # Only populated for methods; empty for properties and attributes.
+        self.parameters = {} if parameters is None else parameters
+        self.return_annotation = return_annotation
+        self.default_values = {} if default_values is None else default_values
+        self.is_public = is_public
+        self.docstring = docstring
 
 
-@dataclass
 class ClassInterface:
     """Represents the complete public interface of a class."""
 
-    module_name: str
-    class_name: str
-    methods: Dict[str, InterfaceSignature] = field(default_factory=dict)
-    properties: Dict[str, InterfaceSignature] = field(default_factory=dict)
-    class_attributes: Dict[str, InterfaceSignature] = field(default_factory=dict)
-    instance_attributes: Dict[str, InterfaceSignature] = field(default_factory=dict)
+    __slots__ = (
+        "module_name",
+        "class_name",
+        "methods",
+        "properties",
+        "class_attributes",
+        "instance_attributes",
+    )
+
+    def __init__(
+        self,
+        module_name: str,
+        class_name: str,
+        methods: Optional[Dict[str, InterfaceSignature]] = None,
+        properties: Optional[Dict[str, InterfaceSignature]] = None,
+        class_attributes: Optional[Dict[str, InterfaceSignature]] = None,
+        instance_attributes: Optional[Dict[str, InterfaceSignature]] = None,
+    ):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.methods = {} if methods is None else methods
+        self.properties = {} if properties is None else properties
+        self.class_attributes = {} if class_attributes is None else class_attributes
+        self.instance_attributes = (
+            {} if instance_attributes is None else instance_attributes
+        )
 
 
 def is_public_name(name: str) -> bool:
@@ -77,25 +120,182 @@ def is_private_name(name: str) -> bool:
 
 def is_dunder(name: str) -> bool:
     """Check if a name is a dunder method (double underscore)."""
-    return name.startswith("__") and name.endswith("__")
+    return name.startswith("__") and name.endswith("__") and len(name) >= 4
+
+
+def get_public_members(obj: Any, raw: bool = False) -> Iterator[Tuple[str, Any]]:
+    """
+    Lazily yield the public ``(name, value)`` members of an object.
+
+    Names come from the object's own ``__dict__`` followed by the class
+    dicts along its MRO (the class's own MRO when ``obj`` is a class), so
+    inherited and class-level members are included as with ``dir()``.
+    Earlier definitions shadow later ones.
+
+    Values come from ``getattr()``; with ``raw=True`` they are read straight
+    from those dicts instead, so descriptors such as properties are returned
+    as-is rather than invoked. Objects without a ``__dict__`` fall back to
+    ``dir()``, or to their class dicts when ``raw`` is set. Wrap the result
+    in ``dict()`` if a mapping is needed.
+    """
+    try:
+        own = vars(obj)
+    except TypeError:
+        if not raw:
+            return (
+                (name, getattr(obj, name))
+                for name in dir(obj)
+                if not name.startswith("_")
+            )
+        own = {}
+
+    mro = obj.__mro__ if isinstance(obj, type) else type(obj).__mro__
+    members: Dict[str, Any] = {}
+    for namespace in (own, *(vars(base) for base in mro)):
+        for name, value in namespace.items():
+            if name not in members and not name.startswith("_"):
+                members[name] = value
+
+    if raw:
+        return iter(members.items())
+    return ((name, getattr(obj, name)) for name in members)
+
+
+# Sentinel for single-lookup ``getattr`` probes.
+_MISSING = object()
+
+_DIR_CACHE: Dict[Any, Tuple[Any, List[str]]] = {}
+
+
+def _dir_cache_key(obj: Any) -> Any:
+    """Build the ``_DIR_CACHE`` key for ``obj``.
+
+    Classes and modules are keyed on their identity. Instances are keyed on
+    their type plus their instance attribute names, so repeated fixture
+    instances of the same class share a single entry.
+    """
+    if isinstance(obj, (type, types.ModuleType)):
+        return id(obj)
+    try:
+        return (id(type(obj)), frozenset(vars(obj)))
+    except TypeError:
+        return id(obj)
+
+
+def _cached_dir(obj: Any) -> List[str]:
+    """Return ``dir(obj)``, memoized for the test session.
+
+    A strong reference to the keyed object is kept alongside the result so
+    its id cannot be reused while the entry is alive.
+    """
+    key = _dir_cache_key(obj)
+    entry = _DIR_CACHE.get(key)
+    if entry is None:
+        owner = obj if isinstance(key, int) else type(obj)
+        entry = _DIR_CACHE[key] = (owner, dir(obj))
+    return entry[1]
+
+
+def _public_names(obj: Any) -> Set[str]:
+    """Return the public names visible on ``obj``, from the cached ``dir()``."""
+    return {name for name in _cached_dir(obj) if not name.startswith("_")}
+
+
+@functools.lru_cache(maxsize=None)
+def _signature_of(func: Callable) -> inspect.Signature:
+    """Return the signature of a plain function, memoized for the session."""
+    return inspect.signature(func)
+
+
+def _underlying_function(func: Callable) -> Callable:
+    """Return the plain function behind a bound method or wrapper."""
+    return inspect.unwrap(getattr(func, "__func__", func))
+
+
+def _signature_cached(func: Callable) -> inspect.Signature:
+    """Return the memoized signature of the function underlying ``func``.
+
+    Bound methods are keyed on their ``__func__`` so every SFAuth instance
+    shares a single cache entry; the returned signature therefore includes
+    the receiver (``self``, or ``cls`` for classmethods) of bound methods.
+    """
+    func = _underlying_function(func)
+    try:
+        return _signature_of(func)
+    except TypeError:
+        # Unhashable callables cannot be cache keys.
+        return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _param_names_of(func: Callable) -> FrozenSet[str]:
+    """Return the parameter names of a plain function, memoized."""
+    return frozenset(_signature_of(func).parameters)
+
+
+def _param_names(func: Callable) -> FrozenSet[str]:
+    """Return the memoized parameter names of the function underlying ``func``."""
+    try:
+        return _param_names_of(_underlying_function(func))
+    except TypeError:
+        # Unhashable callables cannot be cache keys.
+        return frozenset(_signature_cached(func).parameters)
+
+
+_RECEIVER_KINDS = frozenset(
+    (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+)
 
 
-def get_public_members(obj: Any) -> Dict[str, Any]:
-    """Get all public members of an object."""
-    members = {}
-    for name in dir(obj):
-        if is_public_name(name):
-            members[name] = getattr(obj, name)
-    return members
+def _caller_parameters(
+    sig: inspect.Signature, bound: bool
+) -> Iterable[Tuple[str, inspect.Parameter]]:
+    """Return the ``(name, parameter)`` pairs of ``sig`` a caller passes.
+
+    Signatures here are taken from the underlying function, so a bound
+    method's receiver (``self``, or ``cls`` for classmethods) is still the
+    first parameter. ``bound`` says whether the original callable was bound
+    and the receiver must be skipped; the parameter's name is irrelevant.
+    As with ``inspect.signature`` on a bound method, only a positional first
+    parameter is the receiver, so a leading ``*args`` is kept.
+    """
+    items = sig.parameters.items()
+    if bound:
+        first = next(iter(sig.parameters.values()), None)
+        if first is not None and first.kind in _RECEIVER_KINDS:
+            return itertools.islice(items, 1, None)
+    return items
+
+
+# Identity lookups for the sentinels and the annotations that dominate the
+# SFQ API; the keyed objects live for the whole session.
+_ANN_FAST: Dict[int, str] = {
+    id(inspect.Parameter.empty): "any",
+    id(None): "None",
+    id(str): "str",
+    id(int): "int",
+    id(bool): "bool",
+    id(bytes): "bytes",
+    id(Any): "Any",
+    id(type(None)): "NoneType",
+}
 
 
 def serialize_annotation(annotation: Any) -> str:
     """Serialize a type annotation to a string representation."""
-    if annotation is inspect.Parameter.empty:
-        return "any"
-    if annotation is None:
-        return "None"
+    fast = _ANN_FAST.get(id(annotation))
+    if fast is not None:
+        return fast
+
+    try:
+        return _serialize_annotation_cached(type(annotation), annotation)
+    except TypeError:
+        # Unhashable annotation objects cannot be cache keys.
+        return _serialize_annotation_impl(annotation)
+
 
+def _serialize_annotation_impl(annotation: Any) -> str:
+    """Serialize a non-sentinel annotation; see ``serialize_annotation``."""
     try:
         if hasattr(annotation, "__name__"):
             return annotation.__name__
@@ -108,10 +308,43 @@ def serialize_annotation(annotation: Any) -> str:
         return str(annotation)
 
 
-def capture_method_signature(method: Callable, name: str) -> InterfaceSignature:
-    """Capture the signature of a method."""
+@functools.lru_cache(maxsize=512)
+def _serialize_annotation_cached(annotation_type: type, annotation: Any) -> str:
+    """Memoized ``_serialize_annotation_impl``.
+
+    The key includes the annotation's type because equal annotations may
+    render differently, e.g. ``Optional[str] == str | None``.  The SFQ API
+    uses far fewer than 512 distinct annotations, so the bound only caps
+    growth when the helpers are pointed at other modules.
+    """
+    return _serialize_annotation_impl(annotation)
+
+
+# id(default) -> (default, repr(default)); the default is retained so its id
+# cannot be reused by another object while the entry is alive.
+_REPR_CACHE: Dict[int, Tuple[Any, str]] = {}
+
+
+def _cached_repr(value: Any) -> str:
+    """Return ``repr(value)``, memoized by object identity."""
     try:
-        sig = inspect.signature(method)
+        return _REPR_CACHE[id(value)][1]
+    except KeyError:
+        text = repr(value)
+        _REPR_CACHE[id(value)] = (value, text)
+        return text
+
+
+def capture_method_signature(
+    method: Callable, name: str, is_method: bool = False
+) -> InterfaceSignature:
+    """Capture the signature of a method.
+
+    Pass ``is_method=True`` for a plain function read from a class dict so
+    its receiver is dropped, as it is for bound methods.
+    """
+    try:
+        sig = _signature_cached(method)
     except (ValueError, TypeError):
         return InterfaceSignature(
             name=name,
@@ -122,17 +355,15 @@ def capture_method_signature(method: Callable, name: str) -> InterfaceSignature:
     parameters = {}
     default_values = {}
 
-    for param_name, param in sig.parameters.items():
-        if param_name == "self":
-            continue
-
+    bound = is_method or inspect.ismethod(method)
+    for param_name, param in _caller_parameters(sig, bound):
         parameters[param_name] = {
             "annotation": serialize_annotation(param.annotation),
             "kind": str(param.kind),
         }
 
         if param.default is not inspect.Parameter.empty:
-            default_values[param_name] = repr(param.default)
+            default_values[param_name] = _cached_repr(param.default)
 
     return_annotation = serialize_annotation(sig.return_annotation)
 
@@ -146,6 +377,10 @@ def capture_method_signature(method: Callable, name: str) -> InterfaceSignature:
     )
 
 
+# Descriptors that bind to the class rather than to an instance.
+_CLASS_BOUND_DESCRIPTORS = (staticmethod, classmethod, types.ClassMethodDescriptorType)
+
+
 def capture_class_interface(
     cls: Type, instance: Optional[Any] = None
 ) -> ClassInterface:
@@ -155,11 +390,37 @@ def capture_class_interface(
         class_name=cls.__name__,
     )
 
-    for name in dir(cls):
-        if is_dunder(name):
-            continue
-
-        attr = getattr(cls, name)
+    # Walk the MRO once, child definitions winning, so members are read
+    # statically from the class dicts (as inspect.getattr_static would)
+    # without running descriptors or one getattr() per name. The name
+    # checks are inlined because these loops run once per member.
+    _sw = str.startswith
+    merged: Dict[str, Any] = {}
+    for base in cls.__mro__:
+        for name, attr in vars(base).items():
+            # Inlined is_dunder(name)
+            if name in merged or (
+                _sw(name, "__") and name.endswith("__") and len(name) >= 4
+            ):
+                continue
+            merged[name] = attr
+
+    for name, attr in merged.items():
+        # Plain functions and C method descriptors (dict.get, BytesIO.read)
+        # in a class dict are instance methods; class-bound ones are not.
+        is_method = inspect.isfunction(attr) or (
+            inspect.ismethoddescriptor(attr)
+            and not isinstance(attr, _CLASS_BOUND_DESCRIPTORS)
+        )
+        # Bind non-data descriptors as getattr(cls, name) would, so
+        # classmethods (including C ones such as dict.fromkeys) lose cls.
+        attr_type = type(attr)
+        if (
+            not isinstance(attr, property)
+            and hasattr(attr_type, "__get__")
+            and not hasattr(attr_type, "__set__")
+        ):
+            attr = attr.__get__(None, cls)
 
         if isinstance(attr, property):
             interface.properties[name] = InterfaceSignature(
@@ -168,9 +429,11 @@ def capture_class_interface(
                 docstring=attr.__doc__,
             )
         elif callable(attr):
-            if is_public_name(name):
-                interface.methods[name] = capture_method_signature(attr, name)
-        elif is_public_name(name):
+            if not _sw(name, "_"):
+                interface.methods[name] = capture_method_signature(
+                    attr, name, is_method
+                )
+        elif not _sw(name, "_"):
             interface.class_attributes[name] = InterfaceSignature(
                 name=name,
                 kind="attribute",
@@ -178,15 +441,21 @@ def capture_class_interface(
             )
 
     if instance is not None:
-        for name in dir(instance):
-            if is_private_name(name) or is_dunder(name):
+        for name in _cached_dir(instance):
+            # Covers dunders too, which always start with an underscore.
+            if _sw(name, "_"):
+                continue
+
+            # Skip properties before touching the instance so their getters
+            # never run; they are already recorded from the class above.
+            if isinstance(
+                inspect.getattr_static(type(instance), name, None), property
+            ):
                 continue
 
             attr = getattr(instance, name)
 
-            if isinstance(attr, property):
-                continue
-            elif callable(attr):
+            if callable(attr):
                 if name not in interface.methods:
                     interface.methods[name] = capture_method_signature(attr, name)
             else:
@@ -213,12 +482,11 @@ class InterfaceSnapshot:
 
     def capture_module_interfaces(self, module: Any) -> None:
         """Capture all public interfaces from a module."""
-        for name in dir(module):
-            if is_private_name(name):
+        _sw = str.startswith
+        for name, obj in vars(module).items():
+            if _sw(name, "_"):
                 continue
 
-            obj = getattr(module, name)
-
             if inspect.isclass(obj):
                 if issubclass(obj, Exception):
                     self.exceptions[name] = capture_class_interface(obj)
@@ -252,6 +520,32 @@ class InterfaceSnapshot:
         }
 
 
+EXPECTED_SUBMODULES = (
+    "auth",
+    "http_client",
+    "query",
+    "crud",
+    "soap",
+    "exceptions",
+    "utils",
+    "platform_events",
+    "mdapi",
+)
+
+# Resolved once at collection. ``import sfq`` above already loads every
+# submodule, so this only binds them; an ImportError surfaces as a
+# collection error for this file.
+_SUBMODULES = {
+    name: importlib.import_module(f"sfq.{name}") for name in EXPECTED_SUBMODULES
+}
+
+
+@pytest.fixture(scope="module")
+def sfq_exceptions():
+    """Import sfq.exceptions once per module, on first use."""
+    return importlib.import_module("sfq.exceptions")
+
+
 class TestModuleImports:
     """Test that all public modules and their exports are importable."""
 
@@ -280,110 +574,142 @@ class TestModuleImports:
                 obj = getattr(sfq, name)
                 assert obj is not None, f"Export '{name}' is None"
 
-    def test_submodule_imports(self):
+    @pytest.mark.parametrize("submodule", EXPECTED_SUBMODULES)
+    def test_submodule_imports(self, submodule):
         """All expected submodules must be importable."""
-        expected_submodules = [
-            "auth",
-            "http_client",
-            "query",
-            "crud",
-            "soap",
-            "exceptions",
-            "utils",
-            "platform_events",
-            "mdapi",
-        ]
+        assert _SUBMODULES[submodule] is not None, (
+            f"Submodule sfq.{submodule} is None"
+        )
+
 
-        for submodule in expected_submodules:
-            try:
-                module = __import__(f"sfq.{submodule}", fromlist=[submodule])
-                assert module is not None, f"Submodule sfq.{submodule} is None"
-            except ImportError as e:
-                pytest.fail(f"Failed to import sfq.{submodule}: {e}")
+# (child, parent) exception class names, resolved against sfq.exceptions.
+INHERITANCE_CHECKS = [
+    ("AuthenticationError", "SFQException"),
+    ("APIError", "SFQException"),
+    ("QueryError", "APIError"),
+    ("QueryTimeoutError", "QueryError"),
+    ("CRUDError", "APIError"),
+    ("SOAPError", "APIError"),
+    ("HTTPError", "SFQException"),
+    ("ConfigurationError", "SFQException"),
+]
+
+EXPECTED_EXCEPTIONS = (
+    "SFQException",
+    "AuthenticationError",
+    "APIError",
+    "QueryError",
+    "QueryTimeoutError",
+    "CRUDError",
+    "SOAPError",
+    "HTTPError",
+    "ConfigurationError",
+)
 
 
 class TestExceptionHierarchy:
     """Test the exception class hierarchy for stability."""
 
-    def test_base_exception_exists(self):
+    def test_base_exception_exists(self, sfq_exceptions):
         """SFQException must exist as the base exception."""
-        from sfq.exceptions import SFQException
+        assert issubclass(sfq_exceptions.SFQException, Exception)
 
-        assert issubclass(SFQException, Exception)
-
-    def test_exception_hierarchy(self):
+    @pytest.mark.parametrize(
+        "child,parent",
+        INHERITANCE_CHECKS,
+        ids=[child for child, _ in INHERITANCE_CHECKS],
+    )
+    def test_exception_hierarchy(self, sfq_exceptions, child, parent):
         """Exception hierarchy must match expected inheritance."""
-        from sfq.exceptions import (
-            APIError,
-            AuthenticationError,
-            ConfigurationError,
-            CRUDError,
-            HTTPError,
-            QueryError,
-            QueryTimeoutError,
-            SFQException,
-            SOAPError,
-        )
-
-        inheritance_checks = [
-            (AuthenticationError, SFQException, "AuthenticationError"),
-            (APIError, SFQException, "APIError"),
-            (QueryError, APIError, "QueryError"),
-            (QueryTimeoutError, QueryError, "QueryTimeoutError"),
-            (CRUDError, APIError, "CRUDError"),
-            (SOAPError, APIError, "SOAPError"),
-            (HTTPError, SFQException, "HTTPError"),
-            (ConfigurationError, SFQException, "ConfigurationError"),
-        ]
+        exc_class = getattr(sfq_exceptions, child)
+        parent_class = getattr(sfq_exceptions, parent)
 
-        for exc_class, parent, name in inheritance_checks:
-            assert issubclass(exc_class, parent), (
-                f"{name} should inherit from {parent.__name__}"
-            )
+        assert issubclass(exc_class, parent_class), (
+            f"{child} should inherit from {parent}"
+        )
 
     def test_all_exceptions_importable_from_package(self):
         """All exceptions must be importable from the main package."""
-        from sfq import (
-            APIError,
-            AuthenticationError,
-            ConfigurationError,
-            CRUDError,
-            HTTPError,
-            QueryError,
-            QueryTimeoutError,
-            SFQException,
-            SOAPError,
+        namespace = vars(sfq)
+        missing = set(EXPECTED_EXCEPTIONS).difference(namespace)
+        assert not missing, f"Not importable from sfq: {sorted(missing)}"
+
+        exceptions = tuple(namespace[name] for name in EXPECTED_EXCEPTIONS)
+        assert all(issubclass(exc, Exception) for exc in exceptions), (
+            "Should be Exceptions: "
+            f"{[e.__name__ for e in exceptions if not issubclass(e, Exception)]}"
         )
 
-        exceptions = [
-            SFQException,
-            AuthenticationError,
-            APIError,
-            QueryError,
-            QueryTimeoutError,
-            CRUDError,
-            SOAPError,
-            HTTPError,
-            ConfigurationError,
-        ]
 
-        for exc in exceptions:
-            assert issubclass(exc, Exception), f"{exc.__name__} should be an Exception"
+SFAUTH_INIT_REQUIRED_PARAMS = frozenset(
+    {
+        "self",
+        "instance_url",
+        "client_id",
+        "refresh_token",
+        "client_secret",
+    }
+)
+
+# Read-only view so tests cannot mutate the shared expectations.
+SFAUTH_INIT_OPTIONAL_DEFAULTS = types.MappingProxyType(
+    {
+        "api_version": "v65.0",
+        "token_endpoint": "/services/oauth2/token",
+        "access_token": None,
+        "token_expiration_time": None,
+        "token_lifetime": 15 * 60,
+        "user_agent": f"sfq/{__version__}",
+        "sforce_client": "_auto",
+        "proxy": "_auto",
+    }
+)
+
+CQUERY_EXPECTED_PARAMS = frozenset({"query_dict", "batch_size", "max_workers"})
+
+CDELETE_EXPECTED_PARAMS = frozenset({"ids", "batch_size", "max_workers"})
+
+SFAUTH_EXPECTED_PROPERTIES = (
+    "instance_url",
+    "client_id",
+    "client_secret",
+    "refresh_token",
+    "api_version",
+    "token_endpoint",
+    "access_token",
+    "token_expiration_time",
+    "token_lifetime",
+    "user_agent",
+    "sforce_client",
+    "proxy",
+    "org_id",
+    "user_id",
+)
+
+SFAUTH_EXPECTED_METHODS = (
+    "query",
+    "tooling_query",
+    "cquery",
+    "cdelete",
+    "limits",
+    "get_sobject_prefixes",
+    "read_static_resource_name",
+    "read_static_resource_id",
+    "update_static_resource_name",
+    "update_static_resource_id",
+    "debug_cleanup",
+    "open_frontdoor",
+    "records_to_html_table",
+    "list_events",
+    "publish",
+    "publish_batch",
+    "mdapi_retrieve",
+)
 
 
 class TestSFAuthInterface:
     """Test SFAuth class interface stability."""
 
-    @pytest.fixture
-    def sf_auth_instance(self):
-        """Create a basic SFAuth instance for testing."""
-        return SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
     def test_sf_auth_class_exists(self):
         """SFAuth class must be importable."""
         from sfq import SFAuth
@@ -392,38 +718,18 @@ class TestSFAuthInterface:
 
     def test_sf_auth_init_required_parameters(self):
         """SFAuth __init__ must have required parameters."""
-        sig = inspect.signature(SFAuth.__init__)
-        params = list(sig.parameters.keys())
-
-        required_params = [
-            "self",
-            "instance_url",
-            "client_id",
-            "refresh_token",
-            "client_secret",
-        ]
+        params = _param_names(SFAuth.__init__)
 
-        for param in required_params:
-            assert param in params, (
-                f"SFAuth.__init__ missing required parameter: {param}"
-            )
+        assert SFAUTH_INIT_REQUIRED_PARAMS <= params, (
+            "SFAuth.__init__ missing required parameters: "
+            f"{sorted(SFAUTH_INIT_REQUIRED_PARAMS - params)}"
+        )
 
     def test_sf_auth_init_optional_parameters(self):
         """SFAuth __init__ must have optional parameters with correct defaults."""
-        sig = inspect.signature(SFAuth.__init__)
-
-        optional_params = {
-            "api_version": "v65.0",
-            "token_endpoint": "/services/oauth2/token",
-            "access_token": None,
-            "token_expiration_time": None,
-            "token_lifetime": 15 * 60,
-            "user_agent": f"sfq/{__version__}",
-            "sforce_client": "_auto",
-            "proxy": "_auto",
-        }
+        sig = _signature_cached(SFAuth.__init__)
 
-        for param_name, expected_default in optional_params.items():
+        for param_name, expected_default in SFAUTH_INIT_OPTIONAL_DEFAULTS.items():
             assert param_name in sig.parameters, (
                 f"Missing optional parameter: {param_name}"
             )
@@ -438,82 +744,46 @@ class TestSFAuthInterface:
                     f"Parameter '{param_name}' has wrong default: {actual} != {expected_default}"
                 )
 
-    def test_sf_auth_public_properties(self, sf_auth_instance):
+    @pytest.mark.parametrize("prop_name", SFAUTH_EXPECTED_PROPERTIES)
+    def test_sf_auth_public_properties(self, sf_auth_instance, prop_name):
         """SFAuth must have all expected public properties."""
-        expected_properties = [
-            "instance_url",
-            "client_id",
-            "client_secret",
-            "refresh_token",
-            "api_version",
-            "token_endpoint",
-            "access_token",
-            "token_expiration_time",
-            "token_lifetime",
-            "user_agent",
-            "sforce_client",
-            "proxy",
-            "org_id",
-            "user_id",
-        ]
-
-        for prop_name in expected_properties:
-            assert hasattr(sf_auth_instance, prop_name), (
-                f"SFAuth missing expected property: {prop_name}"
-            )
-            try:
-                _ = getattr(sf_auth_instance, prop_name)
-            except Exception as e:
-                pytest.fail(f"Failed to access property '{prop_name}': {e}")
+        try:
+            value = getattr(sf_auth_instance, prop_name, _MISSING)
+        except Exception as e:
+            pytest.fail(f"Failed to access property '{prop_name}': {e}")
+        assert value is not _MISSING, (
+            f"SFAuth missing expected property: {prop_name}"
+        )
 
-    def test_sf_auth_public_methods(self, sf_auth_instance):
+    @pytest.mark.parametrize("method_name", SFAUTH_EXPECTED_METHODS)
+    def test_sf_auth_public_methods(self, sf_auth_instance, method_name):
         """SFAuth must have all expected public methods."""
-        expected_methods = [
-            "query",
-            "tooling_query",
-            "cquery",
-            "cdelete",
-            "limits",
-            "get_sobject_prefixes",
-            "read_static_resource_name",
-            "read_static_resource_id",
-            "update_static_resource_name",
-            "update_static_resource_id",
-            "debug_cleanup",
-            "open_frontdoor",
-            "records_to_html_table",
-            "list_events",
-            "publish",
-            "publish_batch",
-            "mdapi_retrieve",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(sf_auth_instance, method_name), (
-                f"SFAuth missing expected method: {method_name}"
-            )
-            method = getattr(sf_auth_instance, method_name)
-            assert callable(method), f"'{method_name}' should be callable"
+        method = getattr(sf_auth_instance, method_name, _MISSING)
+        assert method is not _MISSING, (
+            f"SFAuth missing expected method: {method_name}"
+        )
+        assert callable(method), f"'{method_name}' should be callable"
 
     def test_query_method_signature(self, sf_auth_instance):
         """query method must have correct signature."""
-        sig = inspect.signature(sf_auth_instance.query)
-        params = list(sig.parameters.keys())
+        sig = _signature_cached(sf_auth_instance.query)
+        params = _param_names(sf_auth_instance.query)
 
-        assert "query" in params, "query() missing 'query' parameter"
-        assert "tooling" in params, "query() missing 'tooling' parameter"
+        assert {"query", "tooling"} <= params, (
+            f"query() missing parameters: {sorted({'query', 'tooling'} - params)}"
+        )
         assert sig.parameters["tooling"].default is False, (
             "tooling default should be False"
         )
 
     def test_cquery_method_signature(self, sf_auth_instance):
         """cquery method must have correct signature."""
-        sig = inspect.signature(sf_auth_instance.cquery)
-        params = list(sig.parameters.keys())
+        sig = _signature_cached(sf_auth_instance.cquery)
+        params = _param_names(sf_auth_instance.cquery)
 
-        assert "query_dict" in params, "cquery() missing 'query_dict' parameter"
-        assert "batch_size" in params, "cquery() missing 'batch_size' parameter"
-        assert "max_workers" in params, "cquery() missing 'max_workers' parameter"
+        assert CQUERY_EXPECTED_PARAMS <= params, (
+            f"cquery() missing parameters: {sorted(CQUERY_EXPECTED_PARAMS - params)}"
+        )
         assert sig.parameters["batch_size"].default == 25, (
             "batch_size default should be 25"
         )
@@ -523,22 +793,21 @@ class TestSFAuthInterface:
 
     def test_cdelete_method_signature(self, sf_auth_instance):
         """cdelete method must have correct signature."""
-        sig = inspect.signature(sf_auth_instance.cdelete)
-        params = list(sig.parameters.keys())
+        sig = _signature_cached(sf_auth_instance.cdelete)
+        params = _param_names(sf_auth_instance.cdelete)
 
-        assert "ids" in params, "cdelete() missing 'ids' parameter"
-        assert "batch_size" in params, "cdelete() missing 'batch_size' parameter"
-        assert "max_workers" in params, "cdelete() missing 'max_workers' parameter"
+        assert CDELETE_EXPECTED_PARAMS <= params, (
+            f"cdelete() missing parameters: {sorted(CDELETE_EXPECTED_PARAMS - params)}"
+        )
         assert sig.parameters["batch_size"].default == 200, (
             "batch_size default should be 200"
         )
 
     def test_get_sobject_prefixes_signature(self, sf_auth_instance):
         """get_sobject_prefixes method must have correct signature."""
-        sig = inspect.signature(sf_auth_instance.get_sobject_prefixes)
-        params = list(sig.parameters.keys())
+        sig = _signature_cached(sf_auth_instance.get_sobject_prefixes)
 
-        assert "key_type" in params, (
+        assert "key_type" in _param_names(sf_auth_instance.get_sobject_prefixes), (
             "get_sobject_prefixes() missing 'key_type' parameter"
         )
         assert sig.parameters["key_type"].default == "id", (
@@ -547,90 +816,158 @@ class TestSFAuthInterface:
 
     def test_static_resource_method_signatures(self, sf_auth_instance):
         """Static resource methods must have correct signatures."""
-        sig_read_name = inspect.signature(sf_auth_instance.read_static_resource_name)
-        assert "resource_name" in sig_read_name.parameters
-        assert "namespace" in sig_read_name.parameters
-        assert sig_read_name.parameters["namespace"].default is None
+        read_name = sf_auth_instance.read_static_resource_name
+        assert {"resource_name", "namespace"} <= _param_names(read_name)
+        assert _signature_cached(read_name).parameters["namespace"].default is None
 
-        sig_read_id = inspect.signature(sf_auth_instance.read_static_resource_id)
-        assert "resource_id" in sig_read_id.parameters
+        read_id = sf_auth_instance.read_static_resource_id
+        assert "resource_id" in _param_names(read_id)
 
-        sig_update_name = inspect.signature(
-            sf_auth_instance.update_static_resource_name
-        )
-        assert "resource_name" in sig_update_name.parameters
-        assert "data" in sig_update_name.parameters
-        assert "namespace" in sig_update_name.parameters
-        assert sig_update_name.parameters["namespace"].default is None
+        update_name = sf_auth_instance.update_static_resource_name
+        assert {"resource_name", "data", "namespace"} <= _param_names(update_name)
+        assert _signature_cached(update_name).parameters["namespace"].default is None
+
+        update_id = sf_auth_instance.update_static_resource_id
+        assert {"resource_id", "data"} <= _param_names(update_id)
+
+
+SFAUTH_SOAP_METHODS = (
+    "_gen_soap_envelope",
+    "_gen_soap_header",
+    "_gen_soap_body",
+    "_extract_soap_result_fields",
+    "_xml_to_json",
+    "_xml_to_dict",
+)
+
+CREATE_EXPECTED_PARAMS = frozenset(
+    {"sobject", "insert_list", "batch_size", "max_workers", "api_type"}
+)
 
-        sig_update_id = inspect.signature(sf_auth_instance.update_static_resource_id)
-        assert "resource_id" in sig_update_id.parameters
-        assert "data" in sig_update_id.parameters
+CUPDATE_EXPECTED_PARAMS = frozenset({"update_dict", "batch_size", "max_workers"})
 
 
 class TestPrivateMethodsExistence:
     """Test that internal/private methods exist for advanced users."""
 
-    @pytest.fixture
-    def sf_auth_instance(self):
-        """Create a basic SFAuth instance for testing."""
-        return SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
     def test_refresh_token_if_needed_exists(self, sf_auth_instance):
         """_refresh_token_if_needed must exist for internal use."""
-        assert hasattr(sf_auth_instance, "_refresh_token_if_needed")
-        assert callable(sf_auth_instance._refresh_token_if_needed)
+        method = getattr(sf_auth_instance, "_refresh_token_if_needed", _MISSING)
+        assert method is not _MISSING
+        assert callable(method)
 
     def test_soap_methods_exist(self, sf_auth_instance):
         """SOAP-related private methods must exist."""
-        soap_methods = [
-            "_gen_soap_envelope",
-            "_gen_soap_header",
-            "_gen_soap_body",
-            "_extract_soap_result_fields",
-            "_xml_to_json",
-            "_xml_to_dict",
-        ]
-
-        for method_name in soap_methods:
-            assert hasattr(sf_auth_instance, method_name), (
-                f"Missing SOAP method: {method_name}"
-            )
-            assert callable(getattr(sf_auth_instance, method_name))
+        for method_name in SFAUTH_SOAP_METHODS:
+            method = getattr(sf_auth_instance, method_name, _MISSING)
+            assert method is not _MISSING, f"Missing SOAP method: {method_name}"
+            assert callable(method)
 
     def test_create_method_exists(self, sf_auth_instance):
         """_create method must exist for internal use."""
-        assert hasattr(sf_auth_instance, "_create")
-        assert callable(sf_auth_instance._create)
+        method = getattr(sf_auth_instance, "_create", _MISSING)
+        assert method is not _MISSING
+        assert callable(method)
 
-        sig = inspect.signature(sf_auth_instance._create)
-        params = list(sig.parameters.keys())
+        params = _param_names(method)
 
-        expected = ["sobject", "insert_list", "batch_size", "max_workers", "api_type"]
-        for param in expected:
-            assert param in params, f"_create() missing parameter: {param}"
+        assert CREATE_EXPECTED_PARAMS <= params, (
+            f"_create() missing parameters: {sorted(CREATE_EXPECTED_PARAMS - params)}"
+        )
 
     def test_cupdate_method_exists(self, sf_auth_instance):
         """_cupdate method must exist for internal use."""
-        assert hasattr(sf_auth_instance, "_cupdate")
-        assert callable(sf_auth_instance._cupdate)
+        method = getattr(sf_auth_instance, "_cupdate", _MISSING)
+        assert method is not _MISSING
+        assert callable(method)
 
-        sig = inspect.signature(sf_auth_instance._cupdate)
-        params = list(sig.parameters.keys())
+        params = _param_names(method)
 
-        expected = ["update_dict", "batch_size", "max_workers"]
-        for param in expected:
-            assert param in params, f"_cupdate() missing parameter: {param}"
+        assert CUPDATE_EXPECTED_PARAMS <= params, (
+            f"_cupdate() missing parameters: {sorted(CUPDATE_EXPECTED_PARAMS - params)}"
+        )
 
     def test_subscribe_method_exists(self, sf_auth_instance):
         """_subscribe method must exist for platform events."""
-        assert hasattr(sf_auth_instance, "_subscribe")
-        assert callable(sf_auth_instance._subscribe)
+        method = getattr(sf_auth_instance, "_subscribe", _MISSING)
+        assert method is not _MISSING
+        assert callable(method)
+
+
+QUERY_CLIENT_EXPECTED_METHODS = frozenset(
+    {
+        "query",
+        "tooling_query",
+        "cquery",
+        "get_sobject_prefixes",
+        "get_sobject_name_from_id",
+        "get_key_prefix_for_sobject",
+        "validate_query_syntax",
+    }
+)
+
+AUTH_MANAGER_EXPECTED_METHODS = frozenset(
+    {
+        "is_token_expired",
+        "get_auth_headers",
+        "needs_token_refresh",
+        "clear_token",
+        "validate_instance_url",
+        "is_sandbox_instance",
+        "get_instance_type",
+        "normalize_instance_url",
+        "get_base_domain",
+        "get_proxy_config",
+        "validate_proxy_config",
+    }
+)
+
+HTTP_CLIENT_EXPECTED_METHODS = frozenset(
+    {
+        "create_connection",
+        "get_common_headers",
+        "send_request",
+        "send_authenticated_request",
+        "send_authenticated_request_with_retry",
+        "refresh_token_and_update_auth",
+        "get_instance_url",
+        "get_api_version",
+        "is_connection_healthy",
+    }
+)
+
+CRUD_CLIENT_EXPECTED_METHODS = frozenset(
+    {
+        "create",
+        "update",
+        "delete",
+        "cupdate",
+        "cdelete",
+        "read_static_resource_name",
+        "read_static_resource_id",
+        "update_static_resource_name",
+        "update_static_resource_id",
+    }
+)
+
+SOAP_CLIENT_EXPECTED_METHODS = frozenset(
+    {
+        "generate_soap_envelope",
+        "generate_soap_header",
+        "generate_soap_body",
+        "extract_soap_result_fields",
+        "xml_to_dict",
+    }
+)
+
+PLATFORM_EVENTS_CLIENT_EXPECTED_METHODS = frozenset(
+    {
+        "list_events",
+        "publish",
+        "publish_batch",
+        "subscribe",
+    }
+)
 
 
 class TestQueryClientInterface:
@@ -646,31 +983,14 @@ class TestQueryClientInterface:
         """QueryClient must have expected public methods."""
         from sfq.query import QueryClient
 
-        expected_methods = [
-            "query",
-            "tooling_query",
-            "cquery",
-            "get_sobject_prefixes",
-            "get_sobject_name_from_id",
-            "get_key_prefix_for_sobject",
-            "validate_query_syntax",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(QueryClient, method_name), (
-                f"QueryClient missing method: {method_name}"
-            )
+        missing = QUERY_CLIENT_EXPECTED_METHODS - _public_names(QueryClient)
+        assert not missing, f"QueryClient missing methods: {sorted(missing)}"
 
     def test_query_method_signature(self):
         """QueryClient.query must have correct signature."""
         from sfq.query import QueryClient
 
-        sig = inspect.signature(QueryClient.query)
-        params = list(sig.parameters.keys())
-
-        assert "self" in params
-        assert "query" in params
-        assert "tooling" in params
+        assert {"self", "query", "tooling"} <= _param_names(QueryClient.query)
 
 
 class TestAuthManagerInterface:
@@ -686,24 +1006,8 @@ class TestAuthManagerInterface:
         """AuthManager must have expected public methods."""
         from sfq.auth import AuthManager
 
-        expected_methods = [
-            "is_token_expired",
-            "get_auth_headers",
-            "needs_token_refresh",
-            "clear_token",
-            "validate_instance_url",
-            "is_sandbox_instance",
-            "get_instance_type",
-            "normalize_instance_url",
-            "get_base_domain",
-            "get_proxy_config",
-            "validate_proxy_config",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(AuthManager, method_name), (
-                f"AuthManager missing method: {method_name}"
-            )
+        missing = AUTH_MANAGER_EXPECTED_METHODS - _public_names(AuthManager)
+        assert not missing, f"AuthManager missing methods: {sorted(missing)}"
 
 
 class TestHTTPClientInterface:
@@ -715,26 +1019,14 @@ class TestHTTPClientInterface:
 
         assert HTTPClient is not None
 
-    def test_http_client_public_methods(self):
+    @pytest.mark.parametrize("method_name", sorted(HTTP_CLIENT_EXPECTED_METHODS))
+    def test_http_client_public_methods(self, method_name):
         """HTTPClient must have expected public methods."""
         from sfq.http_client import HTTPClient
 
-        expected_methods = [
-            "create_connection",
-            "get_common_headers",
-            "send_request",
-            "send_authenticated_request",
-            "send_authenticated_request_with_retry",
-            "refresh_token_and_update_auth",
-            "get_instance_url",
-            "get_api_version",
-            "is_connection_healthy",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(HTTPClient, method_name), (
-                f"HTTPClient missing method: {method_name}"
-            )
+        assert method_name in _public_names(HTTPClient), (
+            f"HTTPClient missing method: {method_name}"
+        )
 
 
 class TestCRUDClientInterface:
@@ -750,22 +1042,8 @@ class TestCRUDClientInterface:
         """CRUDClient must have expected public methods."""
         from sfq.crud import CRUDClient
 
-        expected_methods = [
-            "create",
-            "update",
-            "delete",
-            "cupdate",
-            "cdelete",
-            "read_static_resource_name",
-            "read_static_resource_id",
-            "update_static_resource_name",
-            "update_static_resource_id",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(CRUDClient, method_name), (
-                f"CRUDClient missing method: {method_name}"
-            )
+        missing = CRUD_CLIENT_EXPECTED_METHODS - _public_names(CRUDClient)
+        assert not missing, f"CRUDClient missing methods: {sorted(missing)}"
 
 
 class TestSOAPClientInterface:
@@ -781,18 +1059,8 @@ class TestSOAPClientInterface:
         """SOAPClient must have expected public methods."""
         from sfq.soap import SOAPClient
 
-        expected_methods = [
-            "generate_soap_envelope",
-            "generate_soap_header",
-            "generate_soap_body",
-            "extract_soap_result_fields",
-            "xml_to_dict",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(SOAPClient, method_name), (
-                f"SOAPClient missing method: {method_name}"
-            )
+        missing = SOAP_CLIENT_EXPECTED_METHODS - _public_names(SOAPClient)
+        assert not missing, f"SOAPClient missing methods: {sorted(missing)}"
 
 
 class TestPlatformEventsClientInterface:
@@ -808,17 +1076,8 @@ class TestPlatformEventsClientInterface:
         """PlatformEventsClient must have expected methods."""
         from sfq.platform_events import PlatformEventsClient
 
-        expected_methods = [
-            "list_events",
-            "publish",
-            "publish_batch",
-            "subscribe",
-        ]
-
-        for method_name in expected_methods:
-            assert hasattr(PlatformEventsClient, method_name), (
-                f"PlatformEventsClient missing method: {method_name}"
-            )
+        missing = PLATFORM_EVENTS_CLIENT_EXPECTED_METHODS - _public_names(PlatformEventsClient)
+        assert not missing, f"PlatformEventsClient missing methods: {sorted(missing)}"
 
     def test_platform_events_client_importable_from_main(self):
         """PlatformEventsClient must be importable from main package."""
@@ -827,6 +1086,17 @@ class TestPlatformEventsClientInterface:
         assert PlatformEventsClient is not None
 
 
+MDAPI_RETRIEVE_EXPECTED_PARAMS = frozenset(
+    {
+        "sf",
+        "package",
+        "mdapi_version",
+        "poll_interval_seconds",
+        "max_poll_seconds",
+    }
+)
+
+
 class TestMDAPIInterface:
     """Test MDAPI module interface stability."""
 
@@ -848,18 +1118,12 @@ class TestMDAPIInterface:
         """mdapi_retrieve must have correct signature."""
         from sfq.mdapi import mdapi_retrieve
 
-        sig = inspect.signature(mdapi_retrieve)
-        params = list(sig.parameters.keys())
+        params = _param_names(mdapi_retrieve)
 
-        expected_params = [
-            "sf",
-            "package",
-            "mdapi_version",
-            "poll_interval_seconds",
-            "max_poll_seconds",
-        ]
-        for param in expected_params:
-            assert param in params, f"mdapi_retrieve missing parameter: {param}"
+        assert MDAPI_RETRIEVE_EXPECTED_PARAMS <= params, (
+            "mdapi_retrieve missing parameters: "
+            f"{sorted(MDAPI_RETRIEVE_EXPECTED_PARAMS - params)}"
+        )
 
 
 class TestUtilsInterface:
@@ -900,7 +1164,7 @@ class TestReturnTypeStability:
 
     @pytest.fixture
     def sf_auth_instance(self):
-        """Create a basic SFAuth instance for testing."""
+        """Create a fresh SFAuth instance, as these tests exercise request paths."""
         return SFAuth(
             instance_url="https://test.my.salesforce.com",
             client_id="test_client_id",
@@ -955,6 +1219,30 @@ class TestReturnTypeStability:
         )
 
 
+EXPECTED_PUBLIC_CLASSES = ("SFAuth", "PlatformEventsClient")
+
+SFAUTH_EXPECTED_PUBLIC_ATTRS = frozenset(
+    {
+        "__version__",
+        "instance_url",
+        "client_id",
+        "client_secret",
+        "refresh_token",
+        "api_version",
+        "token_endpoint",
+        "access_token",
+        "token_expiration_time",
+        "token_lifetime",
+        "user_agent",
+        "sforce_client",
+        "proxy",
+        "org_id",
+        "user_id",
+        "platform_events",
+    }
+)
+
+
 class TestDynamicInterfaceDiscovery:
     """
     Dynamically discover and validate all public interfaces.
@@ -965,16 +1253,13 @@ class TestDynamicInterfaceDiscovery:
 
     def test_all_public_classes_discoverable(self):
         """All public classes in sfq must be discoverable via introspection."""
-        public_classes = []
-
-        for name in dir(sfq):
-            if is_public_name(name):
-                obj = getattr(sfq, name)
-                if inspect.isclass(obj):
-                    public_classes.append(name)
+        public_classes = [
+            name
+            for name, obj in vars(sfq).items()
+            if name[:1] != "_" and isinstance(obj, type)
+        ]
 
-        expected_classes = ["SFAuth", "PlatformEventsClient"]
-        for expected in expected_classes:
+        for expected in EXPECTED_PUBLIC_CLASSES:
             assert expected in public_classes, (
                 f"Expected public class '{expected}' not found. "
                 f"Found classes: {public_classes}"
@@ -982,41 +1267,22 @@ class TestDynamicInterfaceDiscovery:
 
     def test_all_public_exceptions_discoverable(self):
         """All public exceptions must be discoverable via introspection."""
-        public_exceptions = []
-
-        for name in dir(sfq):
-            if is_public_name(name):
-                obj = getattr(sfq, name)
-                if inspect.isclass(obj) and issubclass(obj, Exception):
-                    public_exceptions.append(name)
-
-        expected_exceptions = [
-            "SFQException",
-            "AuthenticationError",
-            "APIError",
-            "QueryError",
-            "QueryTimeoutError",
-            "CRUDError",
-            "SOAPError",
-            "HTTPError",
-            "ConfigurationError",
+        public_exceptions = [
+            name
+            for name, obj in vars(sfq).items()
+            if name[:1] != "_"
+            and isinstance(obj, type)
+            and issubclass(obj, Exception)
         ]
 
-        for expected in expected_exceptions:
+        for expected in EXPECTED_EXCEPTIONS:
             assert expected in public_exceptions, (
                 f"Expected exception '{expected}' not found. "
                 f"Found exceptions: {public_exceptions}"
             )
 
-    def test_sf_auth_all_public_members_valid_type(self):
+    def test_sf_auth_all_public_members_valid_type(self, sf_auth_instance):
         """All public members of SFAuth must be callable, property, simple type, or valid object."""
-        sf_auth = SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
         valid_types = (
             type(None),
             bool,
@@ -1030,70 +1296,60 @@ class TestDynamicInterfaceDiscovery:
             tuple,
         )
 
-        for name in dir(sf_auth):
-            if is_public_name(name) and not is_dunder(name):
-                attr = getattr(sf_auth, name)
-
-                is_valid = (
-                    callable(attr)
-                    or isinstance(attr, property)
-                    or isinstance(attr, valid_types)
-                    or hasattr(attr, "__class__")
-                )
+        for name, attr in get_public_members(sf_auth_instance, raw=True):
+            is_valid = (
+                callable(attr)
+                or isinstance(attr, property)
+                or isinstance(attr, valid_types)
+                or hasattr(attr, "__class__")
+            )
 
-                assert is_valid, (
-                    f"Public member '{name}' is not a valid public interface type. "
-                    f"Got: {type(attr)}"
-                )
+            assert is_valid, (
+                f"Public member '{name}' is not a valid public interface type. "
+                f"Got: {type(attr)}"
+            )
 
-    def test_no_unexpected_public_attributes_on_sf_auth(self):
+    def test_no_unexpected_public_attributes_on_sf_auth(self, sf_auth_instance):
         """SFAuth should not have unexpected public instance attributes."""
-        sf_auth = SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
-        expected_public_attrs = {
-            "__version__",
-        }
-
+        # Properties are read statically, so count them as the data
+        # attributes they expose on the instance.
         actual_public_attrs = set()
-        for name in dir(sf_auth):
-            if is_public_name(name) and not is_dunder(name):
-                attr = getattr(sf_auth, name)
-                if not callable(attr) and not isinstance(attr, property):
-                    actual_public_attrs.add(name)
-
-        expected_public_attrs.update(
-            [
-                "instance_url",
-                "client_id",
-                "client_secret",
-                "refresh_token",
-                "api_version",
-                "token_endpoint",
-                "access_token",
-                "token_expiration_time",
-                "token_lifetime",
-                "user_agent",
-                "sforce_client",
-                "proxy",
-                "org_id",
-                "user_id",
-                "platform_events",
-            ]
-        )
+        for name, attr in get_public_members(sf_auth_instance, raw=True):
+            if inspect.isroutine(attr):
+                continue
+            if isinstance(attr, property) or not callable(attr):
+                actual_public_attrs.add(name)
 
-        unexpected = actual_public_attrs - expected_public_attrs
+        unexpected = actual_public_attrs - SFAUTH_EXPECTED_PUBLIC_ATTRS
 
         assert len(unexpected) == 0, (
             f"SFAuth has unexpected public attributes: {unexpected}. "
-            f"If these are intentional, add them to expected_public_attrs."
+            f"If these are intentional, add them to SFAUTH_EXPECTED_PUBLIC_ATTRS."
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _signature_hash_of(func: Callable, bound: bool) -> str:
+    """Build the signature hash of a plain function, memoized.
+
+    ``bound`` drops the leading receiver of a function reached through a
+    bound method.
+    """
+    sig = _signature_cached(func)
+
+    parts = []
+    for name, param in _caller_parameters(sig, bound):
+        part = f"{name}:{serialize_annotation(param.annotation)}"
+        if param.default is not inspect.Parameter.empty:
+            part += f"={_cached_repr(param.default)}"
+        parts.append(part)
+
+    return_annotation = serialize_annotation(sig.return_annotation)
+    parts.append(f"->{return_annotation}")
+
+    return "|".join(parts)
+
+
 class TestInterfaceSignatureStability:
     """
     Test that interface signatures remain stable across versions.
@@ -1103,33 +1359,16 @@ class TestInterfaceSignatureStability:
 
     def capture_signature_hash(self, func: Callable) -> str:
         """Create a hash of a function's signature for comparison."""
-        sig = inspect.signature(func)
-
-        parts = []
-        for name, param in sig.parameters.items():
-            if name == "self":
-                continue
-
-            part = f"{name}:{serialize_annotation(param.annotation)}"
-            if param.default is not inspect.Parameter.empty:
-                part += f"={repr(param.default)}"
-            parts.append(part)
-
-        return_annotation = serialize_annotation(sig.return_annotation)
-        parts.append(f"->{return_annotation}")
-
-        return "|".join(parts)
-
-    def test_sf_auth_query_signature_stable(self):
+        func, bound = _underlying_function(func), inspect.ismethod(func)
+        try:
+            return _signature_hash_of(func, bound)
+        except TypeError:
+            # Unhashable callables cannot be cache keys.
+            return _signature_hash_of.__wrapped__(func, bound)
+
+    def test_sf_auth_query_signature_stable(self, sf_auth_instance):
         """query method signature must remain stable."""
-        sf_auth = SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
-        signature_hash = self.capture_signature_hash(sf_auth.query)
+        signature_hash = self.capture_signature_hash(sf_auth_instance.query)
         expected = "query:str|tooling:bool=False->Optional"
 
         assert signature_hash.startswith("query:str"), (
@@ -1139,16 +1378,9 @@ class TestInterfaceSignatureStability:
             f"query signature missing tooling parameter: {signature_hash}"
         )
 
-    def test_sf_auth_cquery_signature_stable(self):
+    def test_sf_auth_cquery_signature_stable(self, sf_auth_instance):
         """cquery method signature must remain stable."""
-        sf_auth = SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
-        signature_hash = self.capture_signature_hash(sf_auth.cquery)
+        signature_hash = self.capture_signature_hash(sf_auth_instance.cquery)
 
         assert "query_dict" in signature_hash, (
             f"cquery signature missing query_dict: {signature_hash}"
@@ -1185,16 +1417,9 @@ class TestBackwardCompatibility:
         assert sf_auth.api_version == "v65.0"
         assert sf_auth.user_agent == "test_agent"
 
-    def test_sf_auth_default_version_format(self):
+    def test_sf_auth_default_version_format(self, sf_auth_instance):
         """Default API version must follow the expected format."""
-        sf_auth = SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
-        version = sf_auth.api_version
+        version = sf_auth_instance.api_version
         assert version.startswith("v"), f"API version should start with 'v': {version}"
         assert "." in version, f"API version should contain '.': {version}"
 
@@ -1215,16 +1440,6 @@ class TestBackwardCompatibility:
 class TestDocumentationCoverage:
     """Test that public interfaces have documentation."""
 
-    @pytest.fixture
-    def sf_auth_instance(self):
-        """Create a basic SFAuth instance for testing."""
-        return SFAuth(
-            instance_url="https://test.my.salesforce.com",
-            client_id="test_client_id",
-            refresh_token="test_refresh_token",
-            client_secret="test_client_secret",
-        )
-
     def test_sf_auth_init_has_docstring(self):
         """SFAuth.__init__ should have a docstring."""
         assert SFAuth.__init__.__doc__ is not None, (
@@ -1235,12 +1450,16 @@ class TestDocumentationCoverage:
         """All public methods should have docstrings."""
         methods_without_docs = []
 
-        for name in dir(sf_auth_instance):
-            if is_public_name(name) and not is_dunder(name):
-                attr = getattr(sf_auth_instance, name)
-                if callable(attr) and not isinstance(attr, type):
-                    if attr.__doc__ is None:
-                        methods_without_docs.append(name)
+        # Inspect the raw class dict so methods are checked without binding them
+        for name, raw in vars(type(sf_auth_instance)).items():
+            if not is_public_name(name):
+                continue
+            if isinstance(raw, (staticmethod, classmethod)):
+                raw = raw.__func__
+            elif not inspect.isfunction(raw):
+                continue
+            if raw.__doc__ is None:
+                methods_without_docs.append(name)
 
         assert len(methods_without_docs) == 0, (
             f"Public methods without docstrings: {methods_without_docs}"
@@ -1251,5 +1470,218 @@ class TestDocumentationCoverage:
         assert sfq.__doc__ is not None, "sfq module should have a docstring"
 
 
+def _passthrough(func):
+    """Decorator that does not use ``functools.wraps``."""
+
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _CaptureSample:
+    """Small fixture class for the interface capture helpers."""
+
+    def run(self, value: int) -> str:
+        """Instance method."""
+        return str(value)
+
+    @_passthrough
+    def wrapped(self, value):
+        """Hidden behind a ``*args, **kwargs`` wrapper."""
+        return value
+
+    @classmethod
+    def make(cls, a, b=3):
+        """Classmethod whose receiver is ``cls``."""
+        return cls()
+
+    @staticmethod
+    def helper(value):
+        """Staticmethod; ``value`` is a real parameter."""
+        return value
+
+
+class _UnhashableCallable:
+    """Callable instance that cannot be an ``lru_cache`` key."""
+
+    __hash__ = None
+
+    def __call__(self, a, b=2):
+        return a + b
+
+
+class _DictSample(dict):
+    """Builtin-based fixture class, like ``CIProviderConfig``."""
+
+    def extra(self, x):
+        """Python method on a builtin base."""
+        return x
+
+
+class _SnapshotBase:
+    """Base of the snapshot fixture class."""
+
+    base_level = 1
+
+    def inherited(self):
+        """Inherited method."""
+
+
+class _SnapshotSample(_SnapshotBase):
+    """Fixture class pinning ``capture_class_interface`` results."""
+
+    kind = "sample"
+
+    def __init__(self):
+        self.label = "x"
+        self._hidden = 1
+
+    @property
+    def broken(self):
+        """Getter that always raises."""
+        raise RuntimeError("property getters must not run during capture")
+
+    def zeta(self):
+        """Defined before ``alpha`` to pin MRO/definition order."""
+
+    def alpha(self, x=1):
+        """Method with a default."""
+
+
+class _SnapshotError(Exception):
+    """Fixture exception."""
+
+
+def _snapshot_function(a, b=2):
+    """Fixture module-level function."""
+
+
+class TestInterfaceCaptureHelpers:
+    """Test the interface capture helpers against small fixture classes."""
+
+    def test_method_receivers_dropped(self):
+        """self and cls are dropped; staticmethod parameters are kept."""
+        methods = capture_class_interface(_CaptureSample).methods
+
+        assert list(methods["run"].parameters) == ["value"]
+        assert list(methods["make"].parameters) == ["a", "b"]
+        assert methods["make"].default_values == {"b": "3"}
+        assert list(methods["helper"].parameters) == ["value"]
+        # A leading *args is not a receiver and is kept
+        assert list(methods["wrapped"].parameters) == ["args", "kwargs"]
+
+    def test_builtin_base_receivers_dropped(self):
+        """C method and classmethod descriptors drop self/type like functions."""
+        methods = capture_class_interface(_DictSample).methods
+
+        assert list(methods["get"].parameters) == ["key", "default"]
+        assert list(methods["fromkeys"].parameters) == ["iterable", "value"]
+        assert list(methods["popitem"].parameters) == []
+        assert list(methods["extra"].parameters) == ["x"]
+
+    def test_unhashable_callable_signature(self):
+        """Unhashable callables fall back to an uncached signature."""
+        call = _UnhashableCallable()
+        captured = capture_method_signature(call, "call")
+
+        assert list(captured.parameters) == ["a", "b"]
+        assert captured.default_values == {"b": "2"}
+        assert _param_names(call) == frozenset({"a", "b"})
+        assert (
+            TestInterfaceSignatureStability().capture_signature_hash(call)
+            == "a:any|b:any=2|->any"
+        )
+
+    def test_bound_classmethod_receiver_dropped(self):
+        """Bound classmethods captured from an instance drop cls."""
+        interface = capture_class_interface(_CaptureSample, _CaptureSample())
+        bound = capture_method_signature(_CaptureSample().make, "make")
+
+        assert list(interface.methods["make"].parameters) == ["a", "b"]
+        assert list(bound.parameters) == ["a", "b"]
+
+    def test_signature_hash_drops_receiver(self):
+        """Signature hashes skip the receiver of bound methods only."""
+        capture = TestInterfaceSignatureStability().capture_signature_hash
+
+        assert capture(_CaptureSample.make) == "a:any|b:any=3|->any"
+        assert capture(_CaptureSample().run) == "value:int|->str"
+        assert capture(_CaptureSample.helper) == "value:any|->any"
+        assert capture(_CaptureSample().wrapped) == "args:any|kwargs:any|->any"
+
+    def test_get_public_members_includes_class_and_inherited(self):
+        """get_public_members covers class-level and inherited members."""
+        instance_members = dict(get_public_members(_CaptureSample()))
+        class_members = dict(get_public_members(_SnapshotSample))
+
+        assert set(instance_members) == {"run", "wrapped", "make", "helper"}
+        assert list(class_members) == [
+            "kind", "broken", "zeta", "alpha", "base_level", "inherited"
+        ]
+        assert isinstance(class_members["broken"], property)
+
+    def test_get_public_members_raw_values(self):
+        """raw=True returns descriptors as-is, instance attributes first."""
+        members = dict(get_public_members(_SnapshotSample(), raw=True))
+
+        assert list(members) == [
+            "label", "kind", "broken", "zeta", "alpha", "base_level", "inherited"
+        ]
+        # The raising getter never runs
+        assert isinstance(members["broken"], property)
+        assert members["zeta"] is vars(_SnapshotSample)["zeta"]
+
+    def test_capture_class_interface_results(self):
+        """Pin the members, their order and the per-kind fields."""
+        interface = capture_class_interface(_SnapshotSample, _SnapshotSample())
+
+        # Definition order along the MRO, not dir()'s alphabetical order
+        assert list(interface.methods) == ["zeta", "alpha", "inherited"]
+        assert list(interface.properties) == ["broken"]
+        assert list(interface.class_attributes) == ["kind", "base_level"]
+        # Properties are skipped without running their getters
+        assert list(interface.instance_attributes) == ["base_level", "kind", "label"]
+
+        assert interface.methods["zeta"].parameters == {}
+        assert interface.methods["zeta"].default_values == {}
+        assert interface.methods["alpha"].default_values == {"x": "1"}
+
+        prop = interface.properties["broken"]
+        assert prop.kind == "property"
+        assert prop.docstring == "Getter that always raises."
+        assert prop.parameters == {}
+        assert prop.default_values == {}
+        assert interface.class_attributes["kind"].parameters == {}
+        assert interface.instance_attributes["label"].default_values == {}
+
+    def test_interface_snapshot_to_dict(self):
+        """Pin InterfaceSnapshot's module capture and serialization."""
+        module = types.ModuleType("snapshot_fixture")
+        module.Sample = _SnapshotSample
+        module.SampleError = _SnapshotError
+        module.sample_function = _snapshot_function
+        module._private = _snapshot_function
+
+        snapshot = InterfaceSnapshot()
+        snapshot.capture_module_interfaces(module)
+        snapshot.capture_class_with_instance(
+            _SnapshotSample, _SnapshotSample(), name="SampleInstance"
+        )
+
+        sample = {
+            "module": __name__,
+            "methods": ["zeta", "alpha", "inherited"],
+            "properties": ["broken"],
+            "class_attributes": ["kind", "base_level"],
+        }
+        assert snapshot.to_dict() == {
+            "classes": {"Sample": sample, "SampleInstance": sample},
+            "functions": ["sample_function"],
+            "exceptions": ["SampleError"],
+        }
+        assert list(snapshot.functions["sample_function"].parameters) == ["a", "b"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
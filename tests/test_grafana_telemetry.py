@@ -3,221 +3,179 @@
 Test script for Grafana Cloud telemetry integration
 """
 
+import base64
 import os
 import sys
 import json
 import time
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 # Add src to path for testing
 sys.path.insert(0, 'src')
 
-def test_credentials_fetching():
-    """Test credentials fetching from JSON endpoint"""
-    print("Testing credentials fetching...")
-    
-    # Mock the HTTP response
+from sfq.telemetry import TelemetryConfig, _Sender, _build_grafana_payload
+
+# Credentials body served by the mocked Grafana credentials endpoint
+_CREDS_BYTES = json.dumps({
+    "url": "https://logs-prod-001.grafana.net/loki/api/v1/push",
+    "USER_ID": 1234567,
+    "API_KEY": "test_api_key"
+}).encode()
+
+@pytest.fixture
+def grafana_creds_mock():
+    """Patch HTTPSConnection to serve the Grafana credentials payload"""
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.read.return_value = json.dumps({
-        "url": "https://logs-prod-001.grafana.net/loki/api/v1/push",
-        "USER_ID": 1234567,
-        "API_KEY": "test_api_key"
-    }).encode()
+    mock_response.read.return_value = _CREDS_BYTES
     
     with patch('http.client.HTTPSConnection') as mock_conn:
         mock_conn_instance = MagicMock()
         mock_conn_instance.getresponse.return_value = mock_response
         mock_conn.return_value = mock_conn_instance
         
-        # Set environment variable for test
-        os.environ['SFQ_GRAFANACLOUD_URL'] = 'https://test.example.com/creds.json'
-        os.environ['SFQ_TELEMETRY'] = '2'
-        
-        try:
-            from sfq.telemetry import TelemetryConfig
-            
-            config = TelemetryConfig()
-            
-            # Verify credentials were fetched and parsed correctly
-            assert config.user_id == "1234567"
-            assert config.api_key == "test_api_key"
-            assert config.endpoint == "https://logs-prod-001.grafana.net/loki/api/v1/push"
-            assert config.enabled() == True
-            
-            print("[PASS] Credentials fetching test passed")
-        finally:
-            # Clean up environment variables
-            os.environ.pop('SFQ_GRAFANACLOUD_URL', None)
-            os.environ.pop('SFQ_TELEMETRY', None)
+        yield mock_conn_instance, mock_response
+
+def _check_credentials_fetching(mock_conn_instance, mock_response):
+    """Test credentials fetching from JSON endpoint"""
+    config = TelemetryConfig()
+    
+    # Verify credentials were fetched and parsed correctly
+    assert config.user_id == "1234567"
+    assert config.api_key == "test_api_key"
+    assert config.endpoint == "https://logs-prod-001.grafana.net/loki/api/v1/push"
+    assert config.enabled() == True
 
-def test_payload_format():
+def _check_payload_format(mock_conn_instance, mock_response):
     """Test Grafana Loki payload format"""
-    print("Testing payload format...")
+    # Test payload building
+    payload = _build_grafana_payload("test.event", {"key": "value"}, 1)
     
-    # Mock credentials
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.read.return_value = json.dumps({
-        "url": "https://logs-prod-001.grafana.net/loki/api/v1/push",
-        "USER_ID": 1234567,
-        "API_KEY": "test_api_key"
-    }).encode()
+    # Verify Grafana Loki format
+    assert "streams" in payload
+    assert len(payload["streams"]) == 1
     
-    with patch('http.client.HTTPSConnection') as mock_conn:
-        mock_conn_instance = MagicMock()
-        mock_conn_instance.getresponse.return_value = mock_response
-        mock_conn.return_value = mock_conn_instance
-        
-        os.environ['SFQ_TELEMETRY'] = '1'
-        
-        try:
-            from sfq.telemetry import _build_grafana_payload
-            
-            # Test payload building
-            payload = _build_grafana_payload("test.event", {"key": "value"}, 1)
-            
-            # Verify Grafana Loki format
-            assert "streams" in payload
-            assert len(payload["streams"]) == 1
-            
-            stream = payload["streams"][0]
-            assert "stream" in stream
-            assert "values" in stream
-            
-            # Verify stream labels
-            assert stream["stream"]["Language"] == "Python"
-            assert stream["stream"]["source"] == "Code"
-            assert stream["stream"]["sdk"] == "sfq"
-            assert stream["stream"]["telemetry_level"] == "1"
-            
-            # Verify values format (timestamp + JSON log line)
-            values = stream["values"][0]
-            assert len(values) == 2
-            assert isinstance(values[0], str)  # nanosecond timestamp
-            
-            # Verify log line is valid JSON
-            log_line = json.loads(values[1])
-            assert "event_type" in log_line
-            assert "payload" in log_line
-            
-            print("[PASS] Payload format test passed")
-        except Exception as e:
-            print(f"[FAIL] Payload format test failed: {e}")
-            raise
-        finally:
-            os.environ.pop('SFQ_TELEMETRY', None)
+    stream = payload["streams"][0]
+    assert "stream" in stream
+    assert "values" in stream
+    
+    # Verify stream labels
+    assert stream["stream"]["Language"] == "Python"
+    assert stream["stream"]["source"] == "Code"
+    assert stream["stream"]["sdk"] == "sfq"
+    assert stream["stream"]["telemetry_level"] == "1"
+    
+    # Verify values format (timestamp + JSON log line)
+    values = stream["values"][0]
+    assert len(values) == 2
+    assert isinstance(values[0], str)  # nanosecond timestamp
+    
+    # Verify log line is valid JSON
+    log_line = json.loads(values[1])
+    assert "event_type" in log_line
+    assert "payload" in log_line
 
-def test_authentication():
+def _check_authentication(mock_conn_instance, mock_response):
     """Test Basic Authentication header generation"""
-    print("Testing authentication...")
+    # Create sender with test credentials
+    sender = _Sender(
+        "https://logs-prod-001.grafana.net/loki/api/v1/push",
+        "1234567",
+        "test_api_key"
+    )
     
-    # Mock credentials
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.read.return_value = json.dumps({
-        "url": "https://logs-prod-001.grafana.net/loki/api/v1/push",
-        "USER_ID": 1234567,
-        "API_KEY": "test_api_key"
-    }).encode()
+    # Reuse the patched connection for the POST
+    mock_response.read.return_value = b''
     
-    with patch('http.client.HTTPSConnection') as mock_conn:
-        mock_conn_instance = MagicMock()
-        mock_conn_instance.getresponse.return_value = mock_response
-        mock_conn.return_value = mock_conn_instance
-        
-        os.environ['SFQ_TELEMETRY'] = '1'
-        
-        try:
-            from sfq.telemetry import _Sender
-            
-            # Create sender with test credentials
-            sender = _Sender(
-                "https://logs-prod-001.grafana.net/loki/api/v1/push",
-                "1234567",
-                "test_api_key"
-            )
-            
-            # Mock the HTTP connection for sending
-            mock_post_response = MagicMock()
-            mock_post_response.status = 200
-            mock_post_response.read.return_value = b''
-            
-            with patch('http.client.HTTPSConnection') as mock_post_conn:
-                mock_post_conn_instance = MagicMock()
-                mock_post_conn_instance.getresponse.return_value = mock_post_response
-                mock_post_conn.return_value = mock_post_conn_instance
-                
-                # Test sending a payload
-                test_payload = {
-                    "streams": [{
-                        "stream": {"test": "stream"},
-                        "values": [["1234567890", "test log line"]]
-                    }]
-                }
-                
-                sender._post(test_payload)
-                
-                # Verify the request was made with proper authentication
-                call_args = mock_post_conn_instance.request.call_args
-                headers = call_args[1]['headers']
-                
-                assert 'Authorization' in headers
-                assert headers['Authorization'].startswith('Basic ')
-                
-                # Verify Basic Auth encoding
-                import base64
-                expected_auth = base64.b64encode(b"1234567:test_api_key").decode()
-                assert headers['Authorization'] == f"Basic {expected_auth}"
-                
-                print("[PASS] Authentication test passed")
-        except Exception as e:
-            print(f"[FAIL] Authentication test failed: {e}")
-            raise
-        finally:
-            os.environ.pop('SFQ_TELEMETRY', None)
+    # Test sending a payload
+    test_payload = {
+        "streams": [{
+            "stream": {"test": "stream"},
+            "values": [["1234567890", "test log line"]]
+        }]
+    }
+    
+    sender._post(test_payload)
+    
+    # Verify the request was made with proper authentication
+    call_args = mock_conn_instance.request.call_args
+    headers = call_args[1]['headers']
+    
+    assert 'Authorization' in headers
+    assert headers['Authorization'].startswith('Basic ')
+    
+    # Verify Basic Auth encoding
+    expected_auth = base64.b64encode(b"1234567:test_api_key").decode()
+    assert headers['Authorization'] == f"Basic {expected_auth}"
+    
+    # The header is computed once in __init__ and reused for every POST
+    assert sender._headers['Authorization'] == f"Basic {expected_auth}"
+    sender._post(test_payload)
+    assert mock_conn_instance.request.call_args[1]['headers'] is headers
 
-def test_error_handling():
+def _check_error_handling(mock_conn_instance, mock_response):
     """Test error handling for invalid credentials - now fails open"""
-    print("Testing error handling...")
-    
     # Mock failed credentials fetch
-    mock_response = MagicMock()
     mock_response.status = 404
     
-    with patch('http.client.HTTPSConnection') as mock_conn:
-        mock_conn_instance = MagicMock()
-        mock_conn_instance.getresponse.return_value = mock_response
-        mock_conn.return_value = mock_conn_instance
-        
-        os.environ['SFQ_GRAFANACLOUD_URL'] = 'https://invalid.example.com/creds.json'
-        os.environ['SFQ_TELEMETRY'] = '1'
-        
-        try:
-            from sfq.telemetry import TelemetryConfig
-            
-            # With new fail-open behavior, this should not raise an exception
-            # but should result in empty credentials and disabled telemetry
-            config = TelemetryConfig()
-            
-            # Should have empty credentials (fails open)
-            assert config.user_id == "None" or config.user_id == ""
-            assert config.api_key == "None" or config.api_key == ""
-            
-            print("[PASS] Error handling test passed (fails open)")
-        except Exception as e:
-            print(f"[FAIL] Error handling test failed: {e}")
-            raise
-        finally:
-            os.environ.pop('SFQ_GRAFANACLOUD_URL', None)
-            os.environ.pop('SFQ_TELEMETRY', None)
+    # With new fail-open behavior, this should not raise an exception
+    # but should result in empty credentials and disabled telemetry
+    config = TelemetryConfig()
+    
+    # Should have empty credentials (fails open)
+    assert config.user_id == "None" or config.user_id == ""
+    assert config.api_key == "None" or config.api_key == ""
+
+# (case id, check, environment)
+_GRAFANA_CASES = (
+    (
+        "creds",
+        _check_credentials_fetching,
+        {'SFQ_GRAFANACLOUD_URL': 'https://test.example.com/creds.json', 'SFQ_TELEMETRY': '2'},
+    ),
+    ("payload", _check_payload_format, {'SFQ_TELEMETRY': '1'}),
+    ("auth", _check_authentication, {'SFQ_TELEMETRY': '1'}),
+    (
+        "error",
+        _check_error_handling,
+        {'SFQ_GRAFANACLOUD_URL': 'https://invalid.example.com/creds.json', 'SFQ_TELEMETRY': '1'},
+    ),
+)
+
+@pytest.mark.parametrize(
+    "check,env",
+    [case[1:] for case in _GRAFANA_CASES],
+    ids=[case[0] for case in _GRAFANA_CASES],
+)
+def test_grafana_telemetry(grafana_creds_mock, monkeypatch, check, env):
+    """Run a Grafana telemetry check against the shared credentials mock"""
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    
+    check(*grafana_creds_mock)
+
+def test_payload_stream_labels_not_shared():
+    """Each Grafana payload gets its own stream labels dict"""
+    first = _build_grafana_payload("test.event", {"key": "value"}, 1)
+    second = _build_grafana_payload("test.event", {"key": "value"}, 1)
+    
+    first_stream = first["streams"][0]["stream"]
+    second_stream = second["streams"][0]["stream"]
+    assert first_stream == second_stream
+    assert first_stream is not second_stream
+    
+    # Editing one payload's labels must not leak into later events
+    first_stream["sdk"] = "edited"
+    third = _build_grafana_payload("test.event", {"key": "value"}, 1)
+    assert third["streams"][0]["stream"]["sdk"] == "sfq"
 
 def test_base64_credentials():
     """Test base64 encoded credentials functionality"""
     print("Testing base64 encoded credentials...")
     
     # Create valid credentials JSON and encode as base64
-    import base64
     credentials_json = {
         "URL": "https://logs-prod-001.grafana.net/loki/api/v1/push",
         "USER_ID": 1234567,
@@ -231,8 +189,6 @@ def test_base64_credentials():
     os.environ['SFQ_TELEMETRY'] = '2'
     
     try:
-        from sfq.telemetry import TelemetryConfig
-        
         config = TelemetryConfig()
         
         # Verify credentials were decoded and parsed correctly
@@ -258,8 +214,6 @@ def test_base64_error_handling():
     os.environ['SFQ_TELEMETRY'] = '1'
     
     try:
-        from sfq.telemetry import TelemetryConfig
-        
         # This should fail open - return empty credentials and disable telemetry
         config = TelemetryConfig()
         
@@ -284,8 +238,6 @@ def test_url_vs_base64_detection():
     os.environ['SFQ_TELEMETRY'] = '1'
     
     try:
-        from sfq.telemetry import TelemetryConfig
-        
         # Mock the HTTP response for URL case
         mock_response = MagicMock()
         mock_response.status = 200
@@ -319,35 +271,8 @@ def main():
     """Run all tests"""
     print("Running Grafana Cloud telemetry integration tests...\n")
     
-    tests = [
-        test_credentials_fetching,
-        test_payload_format,
-        test_authentication,
-        test_error_handling,
-        test_base64_credentials,
-        test_base64_error_handling,
-        test_url_vs_base64_detection
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except Exception as e:
-            print(f"Test {test.__name__} failed: {e}")
-        print()
-    
-    print(f"Test Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("[SUCCESS] All tests passed! Grafana Cloud integration is working correctly.")
-        return 0
-    else:
-        print("[FAILURE] Some tests failed. Please check the implementation.")
-        return 1
+    # Run through pytest so fixtures are resolved; -s keeps the progress output
+    return pytest.main([__file__, "-v", "-s"])
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file